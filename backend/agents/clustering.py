@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import re
+from collections import Counter, deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -194,13 +195,9 @@ def analyze_graph_structure(
     """
     node_to_difficulty = {}
     
-    # Build adjacency
-    in_degree = {node.node_id: 0 for node in nodes}
-    out_degree = {node.node_id: 0 for node in nodes}
-    
-    for edge in edges:
-        in_degree[edge.target_id] = in_degree.get(edge.target_id, 0) + 1
-        out_degree[edge.source_id] = out_degree.get(edge.source_id, 0) + 1
+    # Degrees from the two id columns (C-level counting, no per-edge dict updates)
+    in_degree = Counter(edge.target_id for edge in edges)
+    out_degree = Counter(edge.source_id for edge in edges)
     
     # Score: high in_degree + low out_degree = advanced
     # High out_degree + low in_degree = foundational
@@ -242,11 +239,11 @@ def _topological_sort(
             in_degree[edge.target_id] += 1
     
     # Kahn's algorithm
-    queue = [node_id for node_id in in_degree if in_degree[node_id] == 0]
+    queue = deque(node_id for node_id in in_degree if in_degree[node_id] == 0)
     result = []
     
     while queue:
-        node_id = queue.pop(0)
+        node_id = queue.popleft()
         result.append(node_id)
         
         for neighbor in graph.get(node_id, []):
@@ -255,8 +252,10 @@ def _topological_sort(
                 queue.append(neighbor)
     
     # Add any remaining nodes (cycle or isolated)
+    seen = set(result)
     for node in nodes:
-        if node.node_id not in result:
+        if node.node_id not in seen:
+            seen.add(node.node_id)
             result.append(node.node_id)
     
     return result
@@ -294,7 +293,6 @@ def cluster_by_difficulty(
     print("[Clustering] Step 2: Extracting main topics and inferring cluster difficulty...")
     cluster_to_main_topic = {}
     cluster_to_difficulty = {}
-    node_id_to_cluster = {}
     
     for cluster_id, cluster_nodes in semantic_clusters.items():
         main_topic = _extract_cluster_main_topic(cluster_nodes)
@@ -303,9 +301,6 @@ def cluster_by_difficulty(
         difficulty_level = _infer_cluster_difficulty(main_topic, cluster_nodes)
         cluster_to_difficulty[cluster_id] = difficulty_level
         
-        for node in cluster_nodes:
-            node_id_to_cluster[node.node_id] = cluster_id
-        
         print(f"  Cluster {cluster_id}: '{main_topic}' (difficulty: {difficulty_level})")
     
     # Step 3: Create difficulty level objects for nodes based on their cluster
@@ -316,15 +311,11 @@ def cluster_by_difficulty(
         2: "Advanced Topics",
         3: "Expert Knowledge",
     }
-    
-    node_to_difficulty_obj = {}
-    for node in nodes:
-        cluster_id = node_id_to_cluster.get(node.node_id)
-        cluster_diff = cluster_to_difficulty.get(cluster_id, 0)
-        node_to_difficulty_obj[node.node_id] = DifficultyLevel(
-            level=cluster_diff,
-            label=difficulty_labels.get(cluster_diff, f"Level {cluster_diff}"),
-        )
+    # DifficultyLevel is frozen, so nodes of the same level can share one instance
+    level_objs = {
+        diff: DifficultyLevel(level=diff, label=difficulty_labels.get(diff, f"Level {diff}"))
+        for diff in set(cluster_to_difficulty.values())
+    }
     
     # Step 4: Order clusters from basic to advanced
     print("[Clustering] Step 4: Ordering clusters by difficulty...")
@@ -333,29 +324,30 @@ def cluster_by_difficulty(
         key=lambda item: cluster_to_difficulty[item[0]]
     )
     
-    # Step 5: Build ordered node list preserving cluster grouping
+    # Step 5: Build ordered node list preserving cluster grouping. Difficulty,
+    # cluster properties and ordering are all filled in one pass over the nodes.
     print("[Clustering] Step 5: Building ordered node list...")
     ordered_nodes = []
     cluster_metadata = {}
+    node_to_difficulty_obj = {}
     
     for cluster_id, cluster_nodes in sorted_clusters:
+        main_topic = cluster_to_main_topic[cluster_id]
+        level_obj = level_objs[cluster_to_difficulty[cluster_id]]
+        for node in cluster_nodes:
+            node_to_difficulty_obj[node.node_id] = level_obj
+            node.properties["cluster_id"] = cluster_id
+            node.properties["cluster_main_topic"] = main_topic
         ordered_nodes.extend(cluster_nodes)
         
         # Store cluster metadata for use in generation
         cluster_metadata[cluster_id] = {
-            "main_topic": cluster_to_main_topic[cluster_id],
+            "main_topic": main_topic,
             "difficulty": cluster_to_difficulty[cluster_id],
             "node_ids": [node.node_id for node in cluster_nodes],
             "node_count": len(cluster_nodes),
         }
     
-    # Add cluster metadata to node properties for reference
-    for node in ordered_nodes:
-        cluster_id = node_id_to_cluster.get(node.node_id)
-        if cluster_id:
-            node.properties["cluster_id"] = cluster_id
-            node.properties["cluster_main_topic"] = cluster_to_main_topic[cluster_id]
-    
     print(f"[Clustering] Complete! Ordered into {len(sorted_clusters)} difficulty-ranked clusters")
     
     return ClusteredKnowledge(
@@ -533,18 +525,19 @@ class KnowledgeGraphBuilder:
 
         # 2) 'related_to' edges when one node's label appears in another node's description
         #    This catches explicit mentions and creates basic semantic links.
-        labels = {k: v['label'].lower() for k, v in node_map.items()}
-        for a_key, a in node_map.items():
+        # Lower-case every label/description once instead of once per pair.
+        labels = [(v['node_id'], v['label'].lower()) for v in node_map.values() if v['label']]
+        for a in node_map.values():
+            a_id = a['node_id']
             a_desc = (a.get('description') or '').lower()
-            for b_key, b in node_map.items():
-                if a_key == b_key:
-                    continue
-                b_label = b.get('label', '').lower()
-                if b_label and b_label in a_desc:
+            if not a_desc:
+                continue
+            for b_id, b_label in labels:
+                if b_id != a_id and b_label in a_desc:
                     # a mentions b -> a related_to b
                     edges.append(KGEdge(
-                        source_id=a['node_id'],
-                        target_id=b['node_id'],
+                        source_id=a_id,
+                        target_id=b_id,
                         relation_type='related_to',
                         properties={'heuristic': 'mention'},
                     ))
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import argparse
 import os
-import json
+import orjson
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
-from agents.pipeline import Pipeline, LLMAnalyzer, KnowledgeGraphBuilder, Clusterer, Orderer, Generator
+from agents.pipeline import DEFAULT_CACHE_DIR, Pipeline, LLMAnalyzer, KnowledgeGraphBuilder, Clusterer, Orderer, Generator
 from agents.types import OutputFormat
 from categorizer.main import categorize_zip_content 
 
@@ -37,10 +37,12 @@ def runner(
             documents.append({
                 'source_path': zip_file_dir / file_path,
                 'category': category,
+                # Keep any parser output inside the job's (temporary) output dir
+                'out_image_dir': output_dir / "images",
             })
 
     # Instantiate pipeline components
-    llm = LLMAnalyzer()
+    llm = LLMAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     kg_builder = KnowledgeGraphBuilder()
     clusterer = Clusterer()
     orderer = Orderer()
@@ -55,6 +57,7 @@ def runner(
         clusterer=clusterer,
         orderer=orderer,
         generator=generator,
+        cache_dir=DEFAULT_CACHE_DIR,
     )
 
     content, generation_metadata = pipeline.run()
@@ -73,4 +76,10 @@ def runner(
 
     # Save generation metadata
     metadata_file = output_dir / f"generation_metadata.json"
-    metadata_file.write_text(json.dumps(generation_metadata, indent=2, default=str), encoding="utf-8")
\ No newline at end of file
+    metadata_file.write_bytes(
+        orjson.dumps(
+            generation_metadata,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    )
\ No newline at end of file
@@ -7,6 +7,13 @@ from typing import Dict, Iterable, List, Optional, Tuple
 import networkx as nx
 
 
+# Edge attribute keys that may carry the relation label, in priority order.
+_REL_KEY_ORDER = ("relation", "rel", "type", "predicate", "label")
+_REL_KEYS = frozenset(_REL_KEY_ORDER)
+_ISA_VALUES = frozenset({"is_a", "isa", "instance_of", "type_of", "subclass_of", "subClassOf"})
+_NORM_TABLE = str.maketrans({" ": "_"})
+
+
 @dataclass(frozen=True)
 class TopicBlock:
     """A cheatsheet section: a cluster of related nodes ordered by difficulty."""
@@ -39,21 +46,30 @@ def build_order(output_directory: str | Path) -> List[TopicBlock]:
     graph_path = _find_graphml(output_directory)
     G = nx.read_graphml(graph_path)
 
-    # Identify candidate "type" edges. Different exports may use different labels.
-    rel_keys = ["relation", "rel", "type", "predicate", "label"]
-    isa_values = {"is_a", "isa", "instance_of", "type_of", "subclass_of", "subClassOf"}
+    # Node-only graph: neither the isa scan nor centrality can tell nodes apart
+    if G.number_of_edges() == 0:
+        return [
+            TopicBlock(
+                title=str(n),
+                node_ids=[str(n)],
+                level=i,
+                evidence={"graphml": str(graph_path), "method": "node_only"},
+            )
+            for i, n in enumerate(G.nodes())
+        ]
 
+    # Identify candidate "type" edges. Different exports may use different labels.
     isa_edges: List[Tuple[str, str]] = []
     for u, v, data in G.edges(data=True):
-        rel = None
-        for k in rel_keys:
-            if k in data:
-                rel = str(data[k])
-                break
-        if rel is None:
+        common = _REL_KEYS & data.keys()
+        if not common:
             continue
-        rel_norm = rel.strip().replace(" ", "_").lower()
-        if rel_norm in isa_values:
+        if len(common) == 1:
+            key = next(iter(common))
+        else:
+            key = next(k for k in _REL_KEY_ORDER if k in common)
+        rel_norm = str(data[key]).strip().translate(_NORM_TABLE).lower()
+        if rel_norm in _ISA_VALUES:
             # if u is_a v, then v is more basic than u (v comes first)
             isa_edges.append((v, u))  # basic -> advanced
 
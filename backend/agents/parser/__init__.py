@@ -1,5 +1,8 @@
-from agents.parser.parser import parse_pdf
+from agents.parser.parser import ParseOptions, new_async_client, parse_pdf, parse_pdf_async
 
 __all__ = [
+    "ParseOptions",
+    "new_async_client",
     "parse_pdf",
+    "parse_pdf_async",
 ]
\ No newline at end of file
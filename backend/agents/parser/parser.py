@@ -1,29 +1,118 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import multiprocessing
 import os
-import warnings
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 import pickle as pkl
-import pymupdf
-import pymupdf.layout
-import pymupdf4llm
+import orjson
 
 from dotenv import load_dotenv
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from agents.types import PageContent, ImportantCategory
 
-# Suppress pypdf warnings about corrupted objects
-warnings.filterwarnings("ignore", category=UserWarning, module="pypdf")
+if TYPE_CHECKING:
+    import pymupdf
+    from openai import AsyncOpenAI, OpenAI
 
 load_dotenv()
 
+# Static part of the page-grouping prompt; the per-page JSON is appended per call.
+_PROMPT_PREFIX = """You are an expert Cheatsheet Content Extractor. Process the provided per-page content (as JSON) to isolate high-signal, examinable material.
+
+Tasks:
+1. Identify logical page groups (consecutive pages covering the same core concept).
+2. Extract ONLY the core technical content, definitions, formulas, and explanations.
+3. Aggressively filter out non-examinable metadata: lecturer names, course codes, office hours, syllabus outlines, administrative announcements, title slides, acknowledgments, and repetitive headers/footers.
+4. Merge pages that are topically related.
+5. Return SKIP for any page group that lacks technical substance (e.g., purely administrative pages, title pages, or course logistics).
+
+Return ONLY a valid JSON object:
+{
+  "page_groups": [
+    {"pages": [1, 2], "content": "Cleaned, typo-corrected technical text...", "topic": "Topic label"},
+    {"pages": [3], "content": "SKIP", "topic": "Administrative/Title"}
+  ]
+}
+
+Rules:
+- IF content is purely administrative (Course intro, Lecturer bio, Grading criteria), set content to "SKIP".
+- Remove all "housekeeping" text (e.g., "Any questions?", "Next week we will cover...").
+- Correct all typos and spelling mistakes.
+- Merge consecutive pages about the same topic.
+- Content string must be dense and fact-focused, ready for summarization.
+- Return ONLY the JSON, no markdown or explanation.
+
+Per-page content (keys are page numbers, values are the page text; use these page numbers in your output):"""
+
+
+@functools.lru_cache(maxsize=1)
+def _pymupdf():
+    """Import PyMuPDF (with the layout engine pymupdf4llm uses) on first use.
+
+    Keeps `import agents.parser` cheap for callers and pool workers that
+    never touch a PDF.
+    """
+    import pymupdf
+    import pymupdf.layout  # noqa: F401
+
+    # Keep MuPDF's chatter about corrupted objects off stderr; it still recovers them
+    pymupdf.TOOLS.mupdf_display_errors(False)
+    return pymupdf
+
+
+@functools.lru_cache(maxsize=1)
+def _pymupdf4llm():
+    _pymupdf()
+    import pymupdf4llm
+
+    return pymupdf4llm
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> OpenAI:
+    """Shared OpenAI client so the HTTP connection pool is reused across PDFs."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+
+
+def new_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI client for `parse_pdf_async`.
+
+    Not cached: its connection pool is bound to the event loop it is first
+    used on, so create one per `asyncio.run` and close it with `async with`.
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cached_pages(stem: str) -> tuple[PageContent, ...]:
+    """Load pages pickled by a previous run (see the dump snippet in `parse_pdf`)."""
+    with open(f"test_data/pages_{stem}.pkl", "rb") as f:
+        return tuple(pkl.load(f))
+
+
 @dataclass(frozen=True)
 class ParseOptions:
     model: str = "gpt-4o-mini"
     min_chars_per_page: int = 30
+    # Page-range parallelism for the PDF -> JSON conversion
+    max_workers: int | None = None  # None = os.cpu_count()
+    parallel_min_pages: int = 32
+    # False: raw MuPDF text (no layout analysis/sorting). True: pymupdf4llm layout path.
+    high_fidelity: bool = False
+    # Only the first `max_pages` pages are converted and sent (None = all)
+    max_pages: int | None = None
 
 
 def json_to_pages_dict(pdf_json: dict) -> dict[int, str]:
@@ -65,22 +154,268 @@ def json_to_pages_dict(pdf_json: dict) -> dict[int, str]:
 
 
 def convert_pdf_to_json(
-    source_path: str | Path,
+    source: str | Path | bytes | pymupdf.Document,
     ) -> Dict[int, str]:
-    """Convert PDF to markdown using pypdf and markdownify."""
-    doc = pymupdf.open(source_path)
-    json_data = pymupdf4llm.to_json(doc)
+    """Convert PDF to JSON using pymupdf4llm.
+
+    `source` may be a path, the raw PDF bytes already read by the caller,
+    or an open document.
+    """
+    pymupdf = _pymupdf()
+    if isinstance(source, pymupdf.Document):
+        doc = source
+    elif isinstance(source, bytes):
+        doc = pymupdf.open(stream=source, filetype="pdf")
+    else:
+        doc = pymupdf.open(source)
+    json_data = _pymupdf4llm().to_json(doc)
     json_data = json.loads(json_data)
-    print(type(json_data))
     return json_data
 
 
+# PDF bytes of the document being split, set in each pool worker by `_init_segment_worker`
+_segment_data: bytes | None = None
+
+
+def _init_segment_worker(data: bytes) -> None:
+    """Pool initializer: hand the PDF bytes to the worker once (inherited as-is under fork)."""
+    global _segment_data
+    _segment_data = data
+
+
+def _convert_segment(vector: tuple[int, int]) -> dict[int, str]:
+    """Pool worker: convert one page-range segment of a PDF.
+
+    Each worker opens the document from the bytes given to its initializer
+    since PyMuPDF documents cannot be pickled; the caller's bytes are used as-is,
+    so nothing is re-read from disk. Page numbers are shifted back to
+    whole-document numbering.
+    """
+    idx, cpu = vector
+    pymupdf = _pymupdf()
+    with pymupdf.open(stream=_segment_data, filetype="pdf") as doc:
+        seg_size = -(-doc.page_count // cpu)
+        seg_from = idx * seg_size
+        seg_to = min(seg_from + seg_size, doc.page_count)
+        if seg_from >= seg_to:
+            return {}
+        sub = pymupdf.open()
+        sub.insert_pdf(doc, from_page=seg_from, to_page=seg_to - 1)
+    pages_dict = json_to_pages_dict(convert_pdf_to_json(sub))
+    return {page_number + seg_from: text for page_number, text in pages_dict.items()}
+
+
+def _page_stop(doc: pymupdf.Document, max_pages: int | None) -> int:
+    """Exclusive page index to stop at; pages past it are never loaded."""
+    return doc.page_count if max_pages is None else min(max_pages, doc.page_count)
+
+
+def _fast_pages(doc: pymupdf.Document, max_pages: int | None = None) -> dict[int, str]:
+    """Plain MuPDF text per page, whitespace-joined like `json_to_pages_dict`."""
+    pymupdf = _pymupdf()
+    flags = pymupdf.TEXTFLAGS_TEXT & ~pymupdf.TEXT_PRESERVE_LIGATURES
+    pages_dict = {}
+    for page in doc.pages(0, _page_stop(doc, max_pages)):
+        text = " ".join(page.get_text("text", sort=False, flags=flags).split())
+        if text:
+            pages_dict[page.number + 1] = text
+    return pages_dict
+
+
+# PyMuPDF is not thread-safe: the parse path's MuPDF work runs under this lock, so
+# concurrent `parse_pdf_async` calls overlap their LLM requests but convert one PDF at a time.
+_mupdf_lock = threading.Lock()
+
+
+def convert_pdf_to_pages(data: bytes, options: ParseOptions) -> dict[int, str]:
+    """Convert a PDF to page_number -> text, splitting large PDFs across processes.
+
+    Safe to call from several threads; conversions are serialized on `_mupdf_lock`.
+    """
+    with _mupdf_lock:
+        return _convert_pdf_to_pages(data, options)
+
+
+def _convert_pdf_to_pages(data: bytes, options: ParseOptions) -> dict[int, str]:
+    pymupdf = _pymupdf()
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        if not options.high_fidelity:
+            return _fast_pages(doc, options.max_pages)
+        stop = _page_stop(doc, options.max_pages)
+        if stop == 0:
+            return {}
+        if stop < doc.page_count:
+            # Bounded parse: lay out only the leading pages, in-process
+            with pymupdf.open() as sub:
+                sub.insert_pdf(doc, from_page=0, to_page=stop - 1)
+                return json_to_pages_dict(convert_pdf_to_json(sub))
+        # ProcessPoolExecutor workers are not daemonic, so the check below cannot see them;
+        # callers already fanning out per process pass max_workers=1 (see Pipeline).
+        cpu = min(options.max_workers or os.cpu_count() or 1, doc.page_count)
+        if (
+            cpu <= 1
+            or doc.page_count < options.parallel_min_pages
+            or multiprocessing.current_process().daemon  # multiprocessing.Pool workers cannot fork
+        ):
+            return json_to_pages_dict(convert_pdf_to_json(doc))
+
+    vectors = [(idx, cpu) for idx in range(cpu)]
+    with multiprocessing.Pool(cpu, initializer=_init_segment_worker, initargs=(data,)) as pool:
+        segments = pool.map(_convert_segment, vectors)
+
+    pages_dict: dict[int, str] = {}
+    for segment in segments:
+        pages_dict.update(segment)
+    return pages_dict
+
+
+def _drop_sparse_pages(pages: dict[int, str], min_chars: int) -> dict[int, str]:
+    """Drop near-empty pages (scans, separators) before they reach the prompt."""
+    return {n: t for n, t in pages.items() if len(t) >= min_chars}
+
+
+def _build_prompt(transformed_json_data: dict[int, str]) -> str:
+    """Append the per-page JSON payload to the static prompt prefix."""
+    payload = orjson.dumps(transformed_json_data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _PROMPT_PREFIX + "\n```json\n" + payload + "\n```\n"
+
+
+def _build_request(prompt: str, options: ParseOptions) -> dict:
+    """Keyword arguments for `client.responses.create`, shared by sync and async clients."""
+    return dict(
+        model=options.model,
+        input=[{
+            "role": "user",
+            "content": [
+                {"type": "input_text", "text": prompt},
+            ],
+        }],
+        temperature=0.0,
+        max_output_tokens=4000,
+    )
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Rate limits and dropped connections are worth retrying; bad requests are not."""
+    import openai
+
+    return isinstance(exc, (openai.RateLimitError, openai.APIConnectionError))
+
+
+# Works for both the sync and async call below (tenacity picks AsyncRetrying for coroutines)
+_llm_retry = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+
+@_llm_retry
+def _create_response(client: OpenAI, prompt: str, options: ParseOptions):
+    return client.responses.create(**_build_request(prompt, options))
+
+
+@_llm_retry
+async def _create_response_async(client: AsyncOpenAI, prompt: str, options: ParseOptions):
+    return await client.responses.create(**_build_request(prompt, options))
+
+
+def _response_text(response) -> str:
+    """Pull the output text out of a Responses API result."""
+    response_text = (getattr(response, "output_text", None) or "").strip()
+    if not response_text:
+        # Fallback if SDK version doesn’t expose output_text for some reason
+        response_text = ""
+        try:
+            for item in response.output:
+                if item.type == "message":
+                    for c in item.content:
+                        if c.type == "output_text":
+                            response_text += c.text
+            response_text = response_text.strip()
+        except Exception:
+            pass
+    return response_text
+
+
+def _resolve_source(source_path: str | Path) -> Path:
+    """Resolve the PDF path once; `strict=True` doubles as the existence check."""
+    try:
+        return Path(source_path).resolve(strict=True)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF not found: {source_path}") from None
+
+
+def _pages_from_response(
+    response_text: str,
+    p: Path,  # already resolved by `_resolve_source`
+    category: ImportantCategory,
+    doc_id_prefix: str,
+) -> List[PageContent]:
+    """Convert the LLM's page_groups JSON into PageContent objects."""
+    # Parse JSON response (keep your existing robustness)
+    try:
+        # Strip common fences if the model misbehaves
+        if response_text.startswith("```json"):
+            response_text = response_text[7:]
+        if response_text.startswith("```"):
+            response_text = response_text[3:]
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+
+        extracted_data = json.loads(response_text)
+    except json.JSONDecodeError as e:
+        print(f"[Parser] Failed to parse LLM JSON response: {e}")
+        print(f"[Parser] Raw response (truncated): {response_text[:500]}")
+        return []
+
+    # Convert page groups to PageContent objects (same as your code).
+    # Every group shares the same source path/category, so intern them once.
+    src = sys.intern(str(p))
+    category = sys.intern(category)
+    doc_id_prefix = sys.intern(doc_id_prefix)
+    pages: List[PageContent] = []
+    for group in extracted_data.get("page_groups", []):
+        content = (group.get("content") or "").strip()
+        if not content or content.upper() == "SKIP":
+            continue
+
+        page_nums = group.get("pages", [])
+        topic = group.get("topic", "Unknown")
+        first_page = page_nums[0] if page_nums else 0
+
+        if len(page_nums) > 1:
+            page_range = f"p{page_nums[0]}-{page_nums[-1]}"
+        else:
+            page_range = f"p{first_page}"
+
+        doc_id = f"{doc_id_prefix}_{page_range}"
+
+        # NOTE: you currently don’t store `topic` in PageContent (unless it has a field).
+        # If PageContent supports extra fields, you can attach it; otherwise we keep identical behavior.
+        pages.append(
+            PageContent(
+                doc_id=doc_id,
+                source_path=src,
+                category=category,
+                page=first_page,
+                text=content,
+                images=[],
+            )
+        )
+
+    print(f"[Parser] Extracted {len(pages)} page groups from {p.name}")
+    return pages
+
+
 def parse_pdf(
     source_path: str | Path,
     category: ImportantCategory,
     out_image_dir: str | Path,
     doc_id_prefix: str | None = None,
     options: ParseOptions | None = None,
+    data: bytes | None = None,
 ) -> List[PageContent]:
     """Parse PDF by sending directly to OpenAI as a document input.
 
@@ -88,169 +423,131 @@ def parse_pdf(
     merges related pages, and filters unimportant content.
 
     Returns a list of PageContent objects from grouped/merged pages.
+    Pass `data` when the PDF bytes are already in memory to skip the read;
+    set `options.max_pages` to parse only the leading pages (e.g. for an index pass).
     """
+    if os.environ.get("PARSER_USE_CACHED_PKL"):
+        return list(_load_cached_pages(Path(source_path).stem))
+
     options = options or ParseOptions()
-    p = Path(source_path)
-    if not p.exists():
-        raise FileNotFoundError(f"PDF not found: {p}")
+    p = _resolve_source(source_path)
 
     doc_id_prefix = doc_id_prefix or p.stem
     out_image_dir = Path(out_image_dir)
     out_image_dir.mkdir(parents=True, exist_ok=True)
 
-    # Read PDF file
+    # Read PDF file once and hand the bytes to PyMuPDF
     try:
-        print("[Parser] Converting PDF to JSON...")
-        json_data = convert_pdf_to_json(source_path)
+        if data is None:
+            data = p.read_bytes()
+        print(f"[Parser] Converting PDF to JSON ({len(data)} bytes)...")
+        transformed_json_data = convert_pdf_to_pages(data, options)
         print("[Parser] PDF conversion complete.")
+        transformed_json_data = _drop_sparse_pages(transformed_json_data, options.min_chars_per_page)
     except Exception as e:
         print(f"[Parser] Error reading PDF {p}: {e}")
         return []
 
+    if not transformed_json_data:
+        # Nothing worth grouping (blank or scanned-only PDF); skip the round trip
+        print(f"[Parser] No page has at least {options.min_chars_per_page} chars, skipping LLM call")
+        return []
+
     # Call OpenAI with PDF document
     try:
-        from openai import OpenAI
-
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
+        if not os.environ.get("OPENAI_API_KEY"):
             print("[Parser] OPENAI_API_KEY not set, cannot process with LLM")
             return []
 
-        client = OpenAI(api_key=api_key)
+        client = _client()
 
-        transformed_json_data = json_to_pages_dict(json_data)
+        prompt = _build_prompt(transformed_json_data)
 
-        prompt = f"""You are an expert Cheatsheet Content Extractor. Process the provided per-page content (as JSON) to isolate high-signal, examinable material.
+        try:
+            response = _create_response(client, prompt, options)
+            response_text = _response_text(response)
+        except Exception as e:
+            print(f"[Parser] LLM API call failed: {e}")
+            return []
 
-Tasks:
-1. Identify logical page groups (consecutive pages covering the same core concept).
-2. Extract ONLY the core technical content, definitions, formulas, and explanations.
-3. Aggressively filter out non-examinable metadata: lecturer names, course codes, office hours, syllabus outlines, administrative announcements, title slides, acknowledgments, and repetitive headers/footers.
-4. Merge pages that are topically related.
-5. Return SKIP for any page group that lacks technical substance (e.g., purely administrative pages, title pages, or course logistics).
+        pages = _pages_from_response(response_text, p, category, doc_id_prefix)
 
-Return ONLY a valid JSON object:
-{{
-  "page_groups": [
-    {{"pages": [1, 2], "content": "Cleaned, typo-corrected technical text...", "topic": "Topic label"}},
-    {{"pages": [3], "content": "SKIP", "topic": "Administrative/Title"}}
-  ]
-}}
+        # with open(f"test_data/pages_{Path(source_path).stem}.pkl", "wb") as f:
+        #     pkl.dump(pages, f)
 
-Rules:
-- IF content is purely administrative (Course intro, Lecturer bio, Grading criteria), set content to "SKIP".
-- Remove all "housekeeping" text (e.g., "Any questions?", "Next week we will cover...").
-- Correct all typos and spelling mistakes.
-- Merge consecutive pages about the same topic.
-- Content string must be dense and fact-focused, ready for summarization.
-- Return ONLY the JSON, no markdown or explanation.
+        # with open(f"test_data/test_json_folder/json_{Path(source_path).stem}.json", "w", encoding="utf-8") as f:
+        #     f.write(json.dumps(transformed_json_data, indent = 2))
 
-Per-page content (keys are page numbers, values are the page text; use these page numbers in your output):
-```json
-{transformed_json_data}
-```
-"""
+        return pages
 
-        try:
-            response = client.responses.create(
-                model=options.model,
-                input=[{
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": prompt},
-                    ],
-                }],
-                temperature=0.0,
-                max_output_tokens=4000,
-            )
+    except Exception as e:
+        print(f"[Parser] LLM extraction failed for {p}: {e}")
+        return []
 
-            response_text = (getattr(response, "output_text", None) or "").strip()
-            if not response_text:
-                # Fallback if SDK version doesn’t expose output_text for some reason
-                response_text = ""
-                try:
-                    for item in response.output:
-                        if item.type == "message":
-                            for c in item.content:
-                                if c.type == "output_text":
-                                    response_text += c.text
-                    response_text = response_text.strip()
-                except Exception:
-                    pass
 
-        except Exception as e:
-            print(f"[Parser] LLM API call failed: {e}")
-            return []
+async def parse_pdf_async(
+    source_path: str | Path,
+    category: ImportantCategory,
+    out_image_dir: str | Path,
+    doc_id_prefix: str | None = None,
+    options: ParseOptions | None = None,
+    data: bytes | None = None,
+    client: AsyncOpenAI | None = None,
+) -> List[PageContent]:
+    """Async variant of `parse_pdf` using `AsyncOpenAI`.
 
-        # Parse JSON response (keep your existing robustness)
-        try:
-            # Strip common fences if the model misbehaves
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-
-            extracted_data = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            print(f"[Parser] Failed to parse LLM JSON response: {e}")
-            print(f"[Parser] Raw response (truncated): {response_text[:500]}")
-            return []
+    The PDF read and JSON conversion run in a worker thread so several
+    documents can be converted and sent to the LLM concurrently.
+    Pass `client` to share one connection pool across calls on the same loop;
+    without it a client is opened and closed for this call.
+    """
+    if os.environ.get("PARSER_USE_CACHED_PKL"):
+        return list(_load_cached_pages(Path(source_path).stem))
 
-        # Convert page groups to PageContent objects (same as your code)
-        pages: List[PageContent] = []
-        for group in extracted_data.get("page_groups", []):
-            content = (group.get("content") or "").strip()
-            if not content or content.upper() == "SKIP":
-                continue
+    options = options or ParseOptions()
+    p = _resolve_source(source_path)
 
-            page_nums = group.get("pages", [])
-            topic = group.get("topic", "Unknown")
-            first_page = page_nums[0] if page_nums else 0
+    doc_id_prefix = doc_id_prefix or p.stem
+    out_image_dir = Path(out_image_dir)
+    out_image_dir.mkdir(parents=True, exist_ok=True)
 
-            if len(page_nums) > 1:
-                page_range = f"p{page_nums[0]}-{page_nums[-1]}"
-            else:
-                page_range = f"p{first_page}"
-
-            doc_id = f"{doc_id_prefix}_{page_range}"
-
-            # NOTE: you currently don’t store `topic` in PageContent (unless it has a field).
-            # If PageContent supports extra fields, you can attach it; otherwise we keep identical behavior.
-            pages.append(
-                PageContent(
-                    doc_id=doc_id,
-                    source_path=str(p.resolve()),
-                    category=category,
-                    page=first_page,
-                    text=content,
-                    images=[],
-                )
-            )
+    try:
+        if data is None:
+            data = await asyncio.to_thread(p.read_bytes)
+        print(f"[Parser] Converting PDF to JSON ({len(data)} bytes)...")
+        transformed_json_data = await asyncio.to_thread(convert_pdf_to_pages, data, options)
+        print("[Parser] PDF conversion complete.")
+        transformed_json_data = _drop_sparse_pages(transformed_json_data, options.min_chars_per_page)
+    except Exception as e:
+        print(f"[Parser] Error reading PDF {p}: {e}")
+        return []
 
-        print(f"[Parser] Extracted {len(pages)} page groups from {p.name}")
+    if not transformed_json_data:
+        # Nothing worth grouping (blank or scanned-only PDF); skip the round trip
+        print(f"[Parser] No page has at least {options.min_chars_per_page} chars, skipping LLM call")
+        return []
 
-        # with open(f"test_data/pages_{Path(source_path).stem}.pkl", "wb") as f:
-        #     pkl.dump(pages, f)
+    try:
+        if not os.environ.get("OPENAI_API_KEY"):
+            print("[Parser] OPENAI_API_KEY not set, cannot process with LLM")
+            return []
 
-        # with open(f"test_data/test_json_folder/json_{Path(source_path).stem}.json", "w", encoding="utf-8") as f:
-        #     f.write(json.dumps(transformed_json_data, indent = 2))
+        prompt = _build_prompt(transformed_json_data)
 
-        return pages
+        try:
+            if client is None:
+                async with new_async_client() as own_client:
+                    response = await _create_response_async(own_client, prompt, options)
+            else:
+                response = await _create_response_async(client, prompt, options)
+            response_text = _response_text(response)
+        except Exception as e:
+            print(f"[Parser] LLM API call failed: {e}")
+            return []
+
+        return _pages_from_response(response_text, p, category, doc_id_prefix)
 
     except Exception as e:
         print(f"[Parser] LLM extraction failed for {p}: {e}")
         return []
-    
-# def parse_pdf(
-#     source_path: str | Path,
-#     category: ImportantCategory,
-#     out_image_dir: str | Path,
-#     doc_id_prefix: str | None = None,
-#     options: ParseOptions | None = None,
-# ) -> List[PageContent]:
-    
-#     with open(f"test_data/pages_{Path(source_path).stem}.pkl", "rb") as f:
-#         pages = pkl.load(f)
-#     return pages
\ No newline at end of file
+
@@ -1,42 +1,208 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import contextlib
+import copy
+import hashlib
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import groupby
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from agents.types import ClusteredKnowledge
 from agents.clustering import KnowledgeGraphBuilder, Clusterer
+from agents.utils.hash import file_digest
+
+# Resolved once; PyMuPDF/OpenAI are only loaded on first parse (see agents.parser).
+try:
+    from agents.parser import (
+        ParseOptions as _ParseOptions,
+        new_async_client as _new_async_client,
+        parse_pdf as _parse_pdf,
+        parse_pdf_async as _parse_pdf_async,
+    )
+    _parser_import_error: Optional[Exception] = None
+except Exception as e:
+    _parse_pdf = _parse_pdf_async = _new_async_client = _ParseOptions = None
+    _parser_import_error = e
+
+try:
+    from agents.generation import generate_one_format as _generate_one_format
+except Exception:
+    _generate_one_format = None
+
+
+# Bump when the pickled types in agents.types change layout, so stale entries read as misses
+_CACHE_SCHEMA = "v2"
+
+# On-disk cache used by the CLI and server runners (relative to the working dir, like the DB)
+DEFAULT_CACHE_DIR = os.environ.get("AGENTS_CACHE_DIR", "cache/agents")
+
+
+def _disk_cache_get(cache_dir: str, key: Optional[str]) -> Any:
+    """Best-effort `diskcache` lookup; any cache error reads as a miss."""
+    if key is None:
+        return None
+    try:
+        import diskcache
+        with diskcache.Cache(cache_dir) as cache:
+            return cache.get(key)
+    except Exception as e:
+        print(f"  Warning: cache unavailable - {e}")
+        return None
+
+
+def _disk_cache_set(cache_dir: str, key: Optional[str], value: Any) -> None:
+    if key is None:
+        return
+    try:
+        import diskcache
+        with diskcache.Cache(cache_dir) as cache:
+            cache.set(key, value)
+    except Exception as e:
+        print(f"  Warning: could not write cache - {e}")
+
+
+def _analyze_safe(llm: "LLMAnalyzer", document: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Process-pool task: never raises, so one bad document cannot abort `Executor.map`."""
+    try:
+        return llm.analyze(document), None
+    except Exception as e:
+        return None, str(e)
 
 
 class LLMAnalyzer:
     """Analyzes documents and extracts topics and important points using LLM."""
 
-    def __init__(self, model="gpt-4o-mini"):
+    def __init__(
+        self,
+        model="gpt-4o-mini",
+        max_concurrency: int = 64,
+        cache_dir: Optional[str] = None,
+        parse_options=None,
+    ):
         self.model = model
+        # Forwarded to every parse; defaults to the parser's options with this model
+        if parse_options is None and _ParseOptions is not None:
+            parse_options = _ParseOptions(model=model)
+        self.parse_options = parse_options
+        # Cap on in-flight LLM requests in `analyze_batch` (rate limits)
+        self.max_concurrency = max_concurrency
+        # When set, results are cached on disk keyed by file content + model
+        self.cache_dir = cache_dir
+
+    def settings_key(self) -> str:
+        """Settings that change the parsed output: model, layout path and page limit."""
+        o = self.parse_options
+        if o is None:
+            return self.model
+        return f"{o.model}:hf{int(o.high_fidelity)}:p{o.max_pages}"
+
+    def _options_for(self, document: Dict[str, Any]):
+        """Parse options for one document; its 'max_pages' overrides the analyzer's limit."""
+        max_pages = document.get("max_pages")
+        if max_pages is None or self.parse_options is None:
+            return self.parse_options
+        return replace(self.parse_options, max_pages=max_pages)
+
+    def _cache_key(self, document: Dict[str, Any]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            digest = file_digest(document["source_path"])
+        except (KeyError, OSError):
+            return None
+        # Content-addressed: the same upload in a fresh temp dir still hits
+        key = f"{_CACHE_SCHEMA}:{digest}:{self.settings_key()}:{document.get('category', 'Lectures')}"
+        max_pages = document.get("max_pages")
+        return key if max_pages is None else f"{key}:p{max_pages}"
+
+    def _cache_get(self, key: Optional[str], document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        info = _disk_cache_get(self.cache_dir, key) if key else None
+        if info is None:
+            return None
+        # Same content may live at a new path (e.g. a fresh upload); re-point provenance
+        src = document["source_path"]
+        resolved = str(Path(src).resolve())
+        pages = [replace(page, source_path=resolved) for page in info["source"][1]]
+        return {**info, "source": (src, pages)}
+
+    def _cache_set(self, key: Optional[str], info: Dict[str, Any]) -> None:
+        # Failed/empty parses are not cached so they are retried next run
+        if key and info["source"][1]:
+            _disk_cache_set(self.cache_dir, key, info)
 
     def analyze(self, document: Dict[str, Any]) -> Dict[str, Any]:
         """Parse document and extract topics and important points.
 
         Args:
             document: Dict with 'source_path', 'category', 'out_image_dir'
+                and optionally 'max_pages' to parse only the leading pages
 
         Returns:
             Dict with 'topics', 'important_points', 'source'
         """
+        if _parse_pdf is None:
+            print(f"Warning: Could not import parser - {_parser_import_error}")
+            return {
+                "topics": [],
+                "important_points": [],
+                "source": document.get("source_path", "unknown"),
+            }
+
+        key = self._cache_key(document)
+        cached = self._cache_get(key, document)
+        if cached is not None:
+            return cached
+
         try:
-            from agents.parser import parse_pdf
+            parsed_pages = _parse_pdf(
+                source_path=document["source_path"],
+                category=document.get("category", "Lectures"),
+                out_image_dir=document.get("out_image_dir", "./images"),
+                options=self._options_for(document),
+            )
         except Exception as e:
-            print(f"Warning: Could not import parser - {e}")
+            print(f"Warning: Failed to parse {document.get('source_path')} - {e}")
+            return {
+                "topics": [],
+                "important_points": [],
+                "source": (document.get("source_path", "unknown"), document.get("page", 0)),
+            }
+
+        info = self._summarize(document, parsed_pages)
+        self._cache_set(key, info)
+        return info
+
+    async def analyze_async(self, document: Dict[str, Any], client=None) -> Dict[str, Any]:
+        """Async variant of `analyze` built on `parse_pdf_async`.
+
+        `client` is an AsyncOpenAI client bound to the running loop (see `analyze_batch`).
+        """
+        if _parse_pdf_async is None:
+            print(f"Warning: Could not import parser - {_parser_import_error}")
             return {
                 "topics": [],
                 "important_points": [],
                 "source": document.get("source_path", "unknown"),
             }
 
+        key = await asyncio.to_thread(self._cache_key, document)
+        cached = await asyncio.to_thread(self._cache_get, key, document)
+        if cached is not None:
+            return cached
+
         try:
-            parsed_pages = parse_pdf(
+            parsed_pages = await _parse_pdf_async(
                 source_path=document["source_path"],
                 category=document.get("category", "Lectures"),
                 out_image_dir=document.get("out_image_dir", "./images"),
+                options=self._options_for(document),
+                client=client,
             )
         except Exception as e:
             print(f"Warning: Failed to parse {document.get('source_path')} - {e}")
@@ -46,20 +212,56 @@ class LLMAnalyzer:
                 "source": (document.get("source_path", "unknown"), document.get("page", 0)),
             }
 
-        topics = []
-        important_points = []
-        pages = []
-
-        for page in parsed_pages:
-            topic = page.text.replace("\n", " ").strip()
-            if topic:
-                topics.append(topic)
-                important_points.append({
-                    "label": topic,
-                    "description": page.text[:200],
-                    "type": "Concept",
-                })
-                pages.append(page)
+        info = self._summarize(document, parsed_pages)
+        await asyncio.to_thread(self._cache_set, key, info)
+        return info
+
+    def analyze_batch(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Analyze several documents at once.
+
+        All LLM requests share one event loop and one client, so they are in
+        flight together instead of one per worker; the PDF conversions in
+        between run one at a time (PyMuPDF is not thread-safe). Results keep
+        the order of `documents`.
+        """
+        async def _all() -> List[Dict[str, Any]]:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            # One client per run: its connection pool is bound to this event loop.
+            # Without a key the parser bails out before any request is made.
+            have_client = _new_async_client is not None and os.environ.get("OPENAI_API_KEY")
+            async with (_new_async_client() if have_client else contextlib.nullcontext()) as client:
+                async def _one(document: Dict[str, Any]) -> Dict[str, Any]:
+                    async with sem:
+                        return await self.analyze_async(document, client)
+
+                return await asyncio.gather(*(_one(d) for d in documents), return_exceptions=True)
+
+        infos = []
+        for document, result in zip(documents, asyncio.run(_all())):
+            if isinstance(result, BaseException):
+                print(f"Warning: Failed to analyze {document.get('source_path')} - {result}")
+                result = {
+                    "topics": [],
+                    "important_points": [],
+                    "source": (document.get("source_path", "unknown"), document.get("page", 0)),
+                }
+            infos.append(result)
+        return infos
+
+    @staticmethod
+    def _summarize(document: Dict[str, Any], parsed_pages) -> Dict[str, Any]:
+        """Turn parsed pages into the topics/important_points dict used downstream."""
+        kept = [
+            (topic, page)
+            for page in parsed_pages
+            if (topic := page.text.replace("\n", " ").strip())
+        ]
+        topics = [topic for topic, _ in kept]
+        important_points = [
+            {"label": topic, "description": page.text[:200], "type": "Concept"}
+            for topic, page in kept
+        ]
+        pages = [page for _, page in kept]
 
         return {
             "topics": topics,
@@ -68,6 +270,32 @@ class LLMAnalyzer:
         }
 
 
+# Fixed preamble/closing of the LaTeX fallback; the title goes between the two header halves.
+_LATEX_HEADER_PRE = r"""
+\documentclass[9pt,a4paper]{article}
+\usepackage[margin=0.4in]{geometry}
+\usepackage{multicol}
+\usepackage{xcolor}
+\usepackage{hyperref}
+\usepackage{amssymb}
+\usepackage{amsmath}
+
+\title{"""
+_LATEX_HEADER_POST = r"""}
+\author{Generated Study Guide}
+\date{}
+
+\begin{document}
+\maketitle
+
+\begin{multicols}{3}
+"""
+_LATEX_FOOTER = r"""
+\end{multicols}
+\end{document}
+"""
+
+
 class Orderer:
     """Orders nodes/clusters for optimal learning flow."""
 
@@ -95,6 +323,10 @@ class Generator:
         """
         self.output_format = output_format
         self.model = model
+        # Resolve the per-format fallback once instead of re-checking the format per call
+        self._fallback_impl = (
+            self._fallback_flashcard if output_format == "flashcard" else self._fallback_latex
+        )
 
     def generate(self, ordered_nodes: ClusteredKnowledge, output_dir: str | None = None) -> tuple[str, dict]:
         """Generate study material in the specified format.
@@ -106,19 +338,20 @@ class Generator:
         Returns:
             Tuple of (content, generation_metadata dict)
         """
-        if not isinstance(ordered_nodes, ClusteredKnowledge):
-            raise ValueError("ordered_nodes must be a ClusteredKnowledge object")
+        # Pipeline._order_nodes always hands over ClusteredKnowledge; stripped under -O
+        assert isinstance(ordered_nodes, ClusteredKnowledge), "ordered_nodes must be a ClusteredKnowledge object"
 
         title = getattr(ordered_nodes, "category", "Study Guide")
 
         try:
-            from agents.generation import generate_one_format
+            if _generate_one_format is None:
+                raise RuntimeError("could not import agents.generation")
             import tempfile
             
             # Use temp dir if output_dir not provided
             output_path = output_dir or tempfile.gettempdir()
             
-            results = generate_one_format(
+            results = _generate_one_format(
                 knowledge=ordered_nodes,
                 output_dir=output_path,
                 title=title,
@@ -138,68 +371,54 @@ class Generator:
         Returns:
             Tuple of (content, empty metadata dict)
         """
-        if self.output_format == "flashcard":
-            import json
-            flashcards = {
-                "title": title,
-                "category": knowledge.category,
-                "cards": [
-                    {
-                        "id": node.node_id,
-                        "front": node.label,
-                        "back": node.description[:200],
-                        "type": node.node_type,
-                        "difficulty": 0,
-                    }
-                    for node in knowledge.nodes
-                ]
-            }
-            return json.dumps(flashcards, indent=2, ensure_ascii=False), {}
-        
-        # Default to LaTeX for cheatsheet and cue_card
-        latex = r"""
-\documentclass[9pt,a4paper]{article}
-\usepackage[margin=0.4in]{geometry}
-\usepackage{multicol}
-\usepackage{xcolor}
-\usepackage{hyperref}
-\usepackage{amssymb}
-\usepackage{amsmath}
-
-\title{""" + title.replace("_", "\\_") + r"""}
-\author{Generated Study Guide}
-\date{}
-
-\begin{document}
-\maketitle
-
-\begin{multicols}{3}
-"""
-
-        current_level = -1
-        for node in knowledge.nodes:
-            diff = knowledge.node_to_difficulty.get(node.node_id)
-            level = diff.level if diff else 0
-            label = diff.label if diff else "Unknown"
-
-            if level != current_level:
-                if current_level >= 0:
-                    latex += "\n"
-                current_level = level
-                latex += f"\n\\section*{{{label}}}\n"
-
-            latex += f"\\textbf{{{node.label}}}\n"
-            if node.description:
-                latex += f"{node.description[:200]}\n\n"
-
-            if node.source_ids:
-                latex += f"\\textit{{Source: {', '.join(str(s) for s in node.source_ids)}}}\n\n"
-
-        latex += r"""
-\end{multicols}
-\end{document}
-"""
-        return latex, {}
+        return self._fallback_impl(knowledge, title)
+
+    def _fallback_flashcard(self, knowledge: ClusteredKnowledge, title: str) -> tuple[str, dict]:
+        """JSON flashcard fallback."""
+        import orjson
+        flashcards = {
+            "title": title,
+            "category": knowledge.category,
+            "cards": [
+                {
+                    "id": node.node_id,
+                    "front": node.label,
+                    "back": node.description[:200],
+                    "type": node.node_type,
+                    "difficulty": 0,
+                }
+                for node in knowledge.nodes
+            ]
+        }
+        return orjson.dumps(flashcards, option=orjson.OPT_INDENT_2).decode(), {}
+
+    @staticmethod
+    def _latex_node(node) -> str:
+        """One node's block in the LaTeX fallback."""
+        out = f"\\textbf{{{node.label}}}\n"
+        if node.description:
+            out += f"{node.description[:200]}\n\n"
+        if node.source_ids:
+            out += f"\\textit{{Source: {', '.join(str(s) for s in node.source_ids)}}}\n\n"
+        return out
+
+    def _fallback_latex(self, knowledge: ClusteredKnowledge, title: str) -> tuple[str, dict]:
+        """LaTeX fallback used for cheatsheet and cue_card."""
+        parts = [_LATEX_HEADER_PRE, title.replace("_", "\\_"), _LATEX_HEADER_POST]
+
+        # One difficulty lookup per node; consecutive nodes at the same level share a section
+        get_diff = knowledge.node_to_difficulty.get
+        resolved = [(node, get_diff(node.node_id)) for node in knowledge.nodes]
+        for i, (_, group) in enumerate(groupby(resolved, key=lambda nd: nd[1].level if nd[1] else 0)):
+            group = list(group)
+            diff = group[0][1]
+            if i:
+                parts.append("\n")
+            parts.append(f"\n\\section*{{{diff.label if diff else 'Unknown'}}}\n")
+            parts.extend(self._latex_node(node) for node, _ in group)
+
+        parts.append(_LATEX_FOOTER)
+        return "".join(parts), {}
 
 
 class Pipeline:
@@ -215,8 +434,17 @@ class Pipeline:
         clusterer: Optional[Clusterer] = None,
         orderer: Optional[Orderer] = None,
         generator: Optional[Generator] = None,
+        use_process_pool: bool = False,
+        cache_dir: Optional[str] = None,
     ):
         self.documents = documents
+        # When set, (kg, clusters) are cached on disk keyed by the input documents,
+        # so re-running with another output_format skips analysis, KG and clustering.
+        self.cache_dir = cache_dir
+        self._proc_pool: Optional[ProcessPoolExecutor] = None
+        # Process pool: one process per document for CPU-heavy (high-fidelity) parsing.
+        # Default: one batched async pass, since the LLM round trip dominates.
+        self.use_process_pool = use_process_pool
         self.output_format = output_format
         self.output_dir = output_dir
         self.llm = llm or LLMAnalyzer()
@@ -231,23 +459,36 @@ class Pipeline:
         Returns:
             Tuple of (generated content, generation_metadata dict)
         """
-        print("[Pipeline] Starting end-to-end pipeline...")
-
-        print("[Pipeline] Step 1: Analyzing documents with LLM (parallel)...")
-        doc_infos = self._analyze_documents_parallel()
-        if not doc_infos:
-            print("[Pipeline] Warning: No documents were successfully analyzed")
-            return "% No documents to generate output from\n", {}
+        try:
+            return self._run()
+        finally:
+            self.close()
 
-        print("[Pipeline] Step 2: Building knowledge graph...")
-        kg = self._build_knowledge_graph(doc_infos)
-        if kg is None:
-            return "% Error building knowledge graph\n", {}
+    def _run(self) -> tuple[str, dict]:
+        print("[Pipeline] Starting end-to-end pipeline...")
 
-        print("[Pipeline] Step 3: Clustering by difficulty...")
-        clusters = self._cluster_knowledge(kg)
-        if clusters is None:
-            return "% Error clustering knowledge\n", {}
+        cache_key, paths = (self._documents_key() if self.cache_dir else None) or (None, {})
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print("[Pipeline] Steps 1-3: Reusing cached knowledge graph and clusters")
+            kg, clusters = self._repoint_sources(cached, paths)
+        else:
+            print("[Pipeline] Step 1: Analyzing documents with LLM (parallel)...")
+            doc_infos = self._analyze_documents_parallel()
+            if not doc_infos:
+                print("[Pipeline] Warning: No documents were successfully analyzed")
+                return "% No documents to generate output from\n", {}
+
+            print("[Pipeline] Step 2: Building knowledge graph...")
+            kg = self._build_knowledge_graph(doc_infos)
+            if kg is None:
+                return "% Error building knowledge graph\n", {}
+
+            print("[Pipeline] Step 3: Clustering by difficulty...")
+            clusters = self._cluster_knowledge(kg)
+            if clusters is None:
+                return "% Error clustering knowledge\n", {}
+            self._cache_set(cache_key, (kg, clusters, paths))
 
         print("[Pipeline] Step 4: Ordering nodes...")
         ordered_nodes = self._order_nodes(clusters)
@@ -263,23 +504,108 @@ class Pipeline:
         print("[Pipeline] ✓ Pipeline complete!")
         return content, metadata
 
+    def _documents_key(self) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Content key for the input set, plus the digest -> source path map.
+
+        Covers the analyzer's model and parse options, then content digest,
+        category and page limit per file. Paths are left out so the same
+        upload extracted into a fresh temp dir still hits.
+        """
+        paths: Dict[str, str] = {}
+        entries = []
+        try:
+            for d in self.documents:
+                digest = file_digest(d["source_path"])
+                paths[digest] = str(d["source_path"])
+                entries.append(f"{digest}\0{d.get('category', '')}\0{d.get('max_pages')}\n")
+        except (KeyError, OSError):
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.llm.settings_key()}\n".encode())
+        for entry in sorted(entries):
+            h.update(entry.encode())
+        return f"{_CACHE_SCHEMA}:{h.hexdigest()}", paths
+
+    @staticmethod
+    def _repoint_sources(cached: Tuple, paths: Dict[str, str]) -> Tuple:
+        """Rewrite node provenance from the cached run's paths to this run's."""
+        kg, clusters, cached_paths = cached
+        moved = {old: paths[digest] for digest, old in cached_paths.items() if digest in paths}
+        if all(old == new for old, new in moved.items()):
+            return kg, clusters
+
+        def _node(node):
+            source_ids = [
+                (moved.get(str(s[0]), s[0]), *s[1:]) if isinstance(s, tuple) and s else s
+                for s in node.source_ids
+            ]
+            return replace(node, source_ids=source_ids)
+
+        nodes, *rest = kg
+        return (
+            ([_node(n) for n in nodes], *rest),
+            replace(clusters, nodes=[_node(n) for n in clusters.nodes]),
+        )
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Tuple]:
+        return _disk_cache_get(self.cache_dir, key)
+
+    def _cache_set(self, key: Optional[str], value: Tuple) -> None:
+        _disk_cache_set(self.cache_dir, key, value)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Process pool shared by every stage of this pipeline, created on first use."""
+        if self._proc_pool is None:
+            # Each worker may itself split a large PDF by page range; keep the pool modest
+            max_workers = min(os.cpu_count() or 1, 8)
+            # fork after PyMuPDF/Objective-C init is unsafe on macOS
+            mp_context = multiprocessing.get_context("spawn") if sys.platform == "darwin" else None
+            self._proc_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+        return self._proc_pool
+
+    def close(self) -> None:
+        """Shut down the shared process pool, if one was started."""
+        if self._proc_pool is not None:
+            self._proc_pool.shutdown()
+            self._proc_pool = None
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def _analyze_documents_parallel(self) -> List[Dict[str, Any]]:
-        """Analyze documents in parallel using ThreadPoolExecutor."""
+        """Analyze documents in parallel.
+
+        By default every document goes through `LLMAnalyzer.analyze_batch`.
+        With `use_process_pool`, each document is parsed in its own process
+        instead, since PyMuPDF work serializes on MuPDF's lock under threads.
+        """
         doc_infos = []
-        max_workers = min(4, len(self.documents))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_doc = {executor.submit(self.llm.analyze, doc): doc for doc in self.documents}
-            completed = 0
-            for future in as_completed(future_to_doc):
-                doc = future_to_doc[future]
-                completed += 1
-                try:
-                    info = future.result()
-                    doc_infos.append(info)
-                    print(f"  ✓ Processed document {completed}/{len(self.documents)}: {doc.get('source_path', 'unknown')}")
-                except Exception as e:
-                    print(f"  ✗ Failed to analyze {doc.get('source_path', 'unknown')}: {e}")
-        # print(doc_infos)
+        if not self.documents:
+            return doc_infos
+        if not self.use_process_pool:
+            doc_infos = self.llm.analyze_batch(self.documents)
+            for i, doc in enumerate(self.documents, 1):
+                print(f"  ✓ Processed document {i}/{len(self.documents)}: {doc.get('source_path', 'unknown')}")
+            return doc_infos
+        if os.environ.get("PYMUPDF_SINGLE_THREAD") == "1":
+            return [self.llm.analyze(doc) for doc in self.documents]
+        # Already one process per document: parse in-process there rather than
+        # every worker forking its own page-range Pool (workers x cpu processes)
+        llm = self.llm
+        if llm.parse_options is not None:
+            llm = copy.copy(llm)
+            llm.parse_options = replace(llm.parse_options, max_workers=1)
+        # map keeps document order and hands results back without per-future bookkeeping
+        results = self._process_pool().map(_analyze_safe, [llm] * len(self.documents), self.documents)
+        for completed, (doc, (info, error)) in enumerate(zip(self.documents, results), 1):
+            if error is not None:
+                print(f"  ✗ Failed to analyze {doc.get('source_path', 'unknown')}: {error}")
+                continue
+            doc_infos.append(info)
+            print(f"  ✓ Processed document {completed}/{len(self.documents)}: {doc.get('source_path', 'unknown')}")
         return doc_infos
 
     def _build_knowledge_graph(self, doc_infos: List[Dict[str, Any]]) -> Optional[Tuple]:
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
 @dataclass(frozen=True)
 class RAGConfig:
     """Minimal config wrapper for Atlas-RAG KG construction."""
@@ -16,9 +22,11 @@ class RAGConfig:
 
     # optional knobs (match ProcessingConfig defaults reasonably)
     max_new_tokens: int = 2048
-    max_workers: int = 3
-    batch_size_triple: int = 3
-    batch_size_concept: int = 16
+    # Extraction is network-bound; defaults keep a hosted endpoint busy and can be
+    # pushed further via env (e.g. a local vLLM with no RPM cap).
+    max_workers: int = field(default_factory=lambda: _env_int("RAG_MAX_WORKERS", min(32, (os.cpu_count() or 1) * 4)))
+    batch_size_triple: int = field(default_factory=lambda: _env_int("RAG_BATCH_SIZE_TRIPLE", 16))
+    batch_size_concept: int = field(default_factory=lambda: _env_int("RAG_BATCH_SIZE_CONCEPT", 64))
     remove_doc_spaces: bool = True
 
 
@@ -51,7 +59,9 @@ def create_rag(
 
     client = OpenAI(
         # base_url = "https://api.deepinfra.com/v1/openai",
-        api_key = api_key
+        api_key = api_key,
+        # SDK-level exponential backoff on 429/5xx, needed at the larger batch sizes
+        max_retries=5,
     ) #base_url=base_url, api_key=api_key)
     llm_generator = LLMGenerator(client=client, model_name="text-embedding-3-small")
 
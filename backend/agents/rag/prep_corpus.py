@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Tuple
+
+import orjson
 
 from agents.types import CorpusItem, PageContent
 
@@ -16,60 +17,63 @@ def chunk_text(text: str, max_chars: int = 2000, overlap_chars: int = 200) -> Li
     t = text.strip()
     if not t:
         return []
-    if len(t) <= max_chars:
+    n = len(t)
+    if n <= max_chars:
         return [t]
 
-    chunks: List[str] = []
-    start = 0
-    while start < len(t):
-        end = min(len(t), start + max_chars)
-        chunk = t[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        if end >= len(t):
-            break
-        # step forward with overlap
-        start = max(0, end - overlap_chars)
-    return chunks
+    chunks = (t[start:end].strip() for start, end in _chunk_bounds(n, max_chars, overlap_chars))
+    return [c for c in chunks if c]
+
+
+def _chunk_bounds(n: int, max_chars: int, overlap_chars: int) -> Iterator[Tuple[int, int]]:
+    """(start, end) offsets of each window over a text of length `n` (> max_chars).
+
+    The window count is known up front, so the last start comes from the range
+    bound instead of an `end >= n` check on every step.
+    """
+    step = max(1, max_chars - overlap_chars)
+    last = -(-(n - max_chars) // step) * step  # first start whose window reaches n
+    return ((start, min(start + max_chars, n)) for start in range(0, last + 1, step))
 
 
-def pages_to_corpus_items(pages: Iterable[PageContent], lang: str = "en") -> List[CorpusItem]:
-    items: List[CorpusItem] = []
+def pages_to_corpus_items(pages: Iterable[PageContent], lang: str = "en") -> Iterator[CorpusItem]:
+    """Yield corpus items lazily so `write_jsonl` can stream them straight to disk."""
     for page in pages:
-        chunks = chunk_text(page.text)
-        for ci, chunk in enumerate(chunks):
-            item_id = f"{page.doc_id}::chunk{ci}"
-            items.append(
-                CorpusItem(
-                    id=item_id,
-                    text=chunk,
-                    metadata={
-                        "lang": lang,
-                        "category": page.category,
-                        "source_path": page.source_path,
-                        "page": page.page,
-                        "images": [
-                            {
-                                "image_id": im.image_id,
-                                "file_path": im.file_path,
-                                "page": im.page,
-                                "width": im.width,
-                                "height": im.height,
-                                "ext": im.ext,
-                            }
-                            for im in page.images
-                        ],
-                    },
-                )
+        # Every chunk of a page carries the same image metadata; build it once and
+        # share the (read-only) list across the page's items.
+        images = [
+            {
+                "image_id": im.image_id,
+                "file_path": im.file_path,
+                "page": im.page,
+                "width": im.width,
+                "height": im.height,
+                "ext": im.ext,
+            }
+            for im in page.images
+        ]
+        for ci, chunk in enumerate(chunk_text(page.text)):
+            yield CorpusItem(
+                id=f"{page.doc_id}::chunk{ci}",
+                text=chunk,
+                metadata={
+                    "lang": lang,
+                    "category": page.category,
+                    "source_path": page.source_path,
+                    "page": page.page,
+                    "images": images,
+                },
             )
-    return items
 
 
 def write_jsonl(items: Iterable[CorpusItem], out_path: str | Path) -> str:
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        for it in items:
-            f.write(json.dumps({"id": it.id, "text": it.text, "metadata": it.metadata}, ensure_ascii=False))
-            f.write("\n")
+    lines = (
+        orjson.dumps({"id": it.id, "text": it.text, "metadata": it.metadata}) + b"\n"
+        for it in items
+    )
+    with p.open("wb", buffering=1 << 20) as f:
+        f.writelines(lines)
     return str(p.resolve())
+
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List
+
+import orjson
 
 from agents.types import PageContent
-from agents.utils.hash import sha256_file
+from agents.utils.hash import sha256_files
 
 
 @dataclass
@@ -31,27 +33,28 @@ class JobManifest:
 def write_manifest(manifest_path: str | Path, manifest: JobManifest) -> None:
     p = Path(manifest_path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(asdict(manifest), ensure_ascii=False, indent=2), encoding="utf-8")
+    # orjson serializes (nested) dataclasses natively; no asdict() copy needed
+    p.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
 
-def build_source_records(pages: List[PageContent]) -> List[SourceRecord]:
+def build_source_records(pages: Iterable[PageContent]) -> List[SourceRecord]:
     """Collapse per-page provenance into per-file provenance for easy auditing."""
-    by_file: Dict[str, Dict[str, object]] = {}
+    counts: Counter[str] = Counter()
+    categories: Dict[str, str] = {}
     for page in pages:
-        rec = by_file.setdefault(
-            page.source_path,
-            {"category": page.category, "count": 0},
-        )
-        rec["count"] = int(rec["count"]) + 1
-
-    out: List[SourceRecord] = []
-    for source_path, rec in sorted(by_file.items()):
-        out.append(
-            SourceRecord(
-                category=str(rec["category"]),
-                source_path=source_path,
-                sha256=sha256_file(source_path),
-                num_pages_parsed=int(rec["count"]),
-            )
+        counts[page.source_path] += 1
+        # first page of a file decides its category
+        categories.setdefault(page.source_path, page.category)
+
+    # One hashing thread per CPU (sha256_files' default), capped at the file count
+    digests = sha256_files(counts)
+
+    return [
+        SourceRecord(
+            category=categories[source_path],
+            source_path=source_path,
+            sha256=digests[source_path],
+            num_pages_parsed=counts[source_path],
         )
-    return out
+        for source_path in sorted(counts)
+    ]
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import argparse
-import os
-import json
 from pathlib import Path
 
-from agents.pipeline import Pipeline, LLMAnalyzer, KnowledgeGraphBuilder, Clusterer, Orderer, Generator
+import orjson
+
+from agents.pipeline import DEFAULT_CACHE_DIR, Pipeline, LLMAnalyzer, KnowledgeGraphBuilder, Clusterer, Orderer, Generator
 from agents.types import OutputFormat
 
 
@@ -65,20 +65,21 @@ def main() -> int:
 
 
     grouped_path = Path(args.grouped)
-    grouped = json.loads(grouped_path.read_text(encoding="utf-8"))
+    grouped = orjson.loads(grouped_path.read_bytes())
 
     # Convert grouped dict to document list for pipeline
     documents = []
+    test_data_dir = Path.cwd() / "test_data"
     for category, files in grouped.items():
         for file_path in files:
             documents.append({
-                'source_path': os.path.join(os.getcwd(), "test_data", file_path),
+                'source_path': str(test_data_dir / file_path),
                 'category': category,
                 'out_image_dir': f"{args.job_id}/images"
             })
 
     # Instantiate pipeline components
-    llm = LLMAnalyzer()
+    llm = LLMAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     kg_builder = KnowledgeGraphBuilder()
     clusterer = Clusterer()
     orderer = Orderer()
@@ -93,6 +94,7 @@ def main() -> int:
         clusterer=clusterer,
         orderer=orderer,
         generator=generator,
+        cache_dir=DEFAULT_CACHE_DIR,
     )
 
     content, generation_metadata = pipeline.run()
@@ -113,7 +115,13 @@ def main() -> int:
     
     # Save generation metadata
     metadata_file = out_dir / f"generation_metadata.json"
-    metadata_file.write_text(json.dumps(generation_metadata, indent=2, default=str), encoding="utf-8")
+    metadata_file.write_bytes(
+        orjson.dumps(
+            generation_metadata,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    )
     
     print(f"✓ Pipeline complete: {output_file}")
     print("\nGenerated files:")
@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 
@@ -7,6 +8,17 @@ ImportantCategory = Literal["Lectures", "Tutorials", "Labs"]
 OutputFormat = Literal["cheatsheet", "keynote", "flashcard"]
 
 
+def _setstate_compat(self, state) -> None:
+    """Unpickle frozen slotted dataclasses from either state layout.
+
+    Slotted pickles carry a tuple of field values; pickles written before these
+    types had `__slots__` (e.g. the fixtures in test_data/) carry a `__dict__`.
+    """
+    items = state.items() if isinstance(state, dict) else zip((f.name for f in fields(self)), state)
+    for name, value in items:
+        object.__setattr__(self, name, value)
+
+
 class GroupedFiles(TypedDict, total=False):
     Lectures: List[str]
     Tutorials: List[str]
@@ -14,7 +26,7 @@ class GroupedFiles(TypedDict, total=False):
     Miscellaneous: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageRef:
     image_id: str
     file_path: str  # absolute path on disk where we saved the extracted image, to change into database if got time
@@ -23,8 +35,10 @@ class ImageRef:
     height: int
     ext: str
 
+    __setstate__ = _setstate_compat
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageContent:
     doc_id: str
     source_path: str
@@ -33,8 +47,10 @@ class PageContent:
     text: str
     images: List[ImageRef]
 
+    __setstate__ = _setstate_compat
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorpusItem:
     """Atlas-RAG JSONL item.
 
@@ -45,8 +61,10 @@ class CorpusItem:
     text: str
     metadata: Dict[str, object]
 
+    __setstate__ = _setstate_compat
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class KGNode:
     """Knowledge graph node extracted by Atlas-RAG."""
     
@@ -57,8 +75,15 @@ class KGNode:
     properties: Dict[str, Any] = field(default_factory=dict)
     source_ids: List[str] = field(default_factory=list)  # which corpus items this came from
 
+    __setstate__ = _setstate_compat
+
+    def __post_init__(self) -> None:
+        # A handful of distinct types shared by every node; interned so equality is a pointer check
+        if type(self.node_type) is str:
+            object.__setattr__(self, "node_type", sys.intern(self.node_type))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KGEdge:
     """Knowledge graph edge/relationship."""
     
@@ -67,17 +92,24 @@ class KGEdge:
     relation_type: str
     properties: Dict[str, Any] = field(default_factory=dict)
 
+    __setstate__ = _setstate_compat
 
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        if type(self.relation_type) is str:
+            object.__setattr__(self, "relation_type", sys.intern(self.relation_type))
+
+
+@dataclass(frozen=True, slots=True)
 class DifficultyLevel:
     """Ranked difficulty level for clustering."""
     
     level: int  # 0 = basic, 1 = intermediate, 2 = advanced, 3+ = expert
     label: str  # "Fundamentals", "Core Concepts", "Advanced Topics", etc.
 
+    __setstate__ = _setstate_compat
+
 
-@dataclass
-@dataclass
+@dataclass(slots=True)
 class ClusteredKnowledge:
     """Knowledge clustered and ranked by difficulty."""
     
@@ -88,7 +120,7 @@ class ClusteredKnowledge:
     cluster_metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # cluster_id -> {main_topic, difficulty, nodes}
     
     
-@dataclass
+@dataclass(slots=True)
 class GenerationRequest:
     """Request to generate output (cheatsheet, cue card, flashcard)."""
     
@@ -98,7 +130,7 @@ class GenerationRequest:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedOutput:
     """Generated study material."""
     
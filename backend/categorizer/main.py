@@ -1,64 +1,138 @@
+import asyncio
+import json
 import os
+import re
 import zipfile
-import concurrent.futures
+from pathlib import PurePosixPath
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 # --- CONFIGURATION ---
 load_dotenv()
 
 CATEGORIES = ["Lecture", "Lab", "Tutorial", "Misc"]
-MAX_WORKERS = 10 
-
-client = OpenAI()
+MAX_CONCURRENCY = 50  # in-flight AI requests
+BATCH_SIZE = 32  # paths classified per AI request
 
 # --- AI FUNCTION ---
 
 @retry(wait=wait_exponential(multiplier=1, min=1, max=10), stop=stop_after_attempt(5), reraise=True)
-def call_openai_with_retry(system_instruction, user_prompt):
-    completion = client.chat.completions.create(
+async def call_openai_with_retry(client, system_instruction, user_prompt, json_mode=False):
+    completion = await client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": system_instruction},
             {"role": "user", "content": user_prompt}
         ],
         temperature=0.0,
+        **({"response_format": {"type": "json_object"}} if json_mode else {}),
     )
-    return completion.choices[0].message.content.strip().title()
+    content = completion.choices[0].message.content.strip()
+    # JSON replies are parsed as-is; free-text category names get normalised
+    return content if json_mode else content.title()
+
+SYSTEM_INSTRUCTION = "You are a helpful file organization assistant."
+
+CATEGORY_CONTEXT = """
+Context:
+- Lecture: Slides, theory, chapters, week numbers usually imply lectures.
+- Lab: Code, practicals, experiments, 'practical'.
+- Tutorial: Problem sets, exercises, sheets, homework.
+- Misc: Syllabus, schedules, admin docs.
+"""
 
-def get_category_from_ai(file_path_str):
+# Static part of the batch prompt; only the JSON list of paths is appended per request
+BATCH_PROMPT_PREFIX = f"""
+Classify each file path into exactly one of these categories: {', '.join(CATEGORIES)}.
+{CATEGORY_CONTEXT}
+Reply ONLY with a JSON object {{"categories": [...]}} holding one category name per path, in the same order.
+
+Paths (JSON array):
+"""
+
+def _path_skeleton(file_path_str):
+    """Lower-cased parent dir + file stem with digit runs collapsed to '#'."""
+    p = PurePosixPath(file_path_str)
+    return f"{str(p.parent).lower()}/{re.sub(r'[0-9]+', '#', p.stem.lower())}"
+
+def _to_category(label):
+    """Title-cased label if it names a known category, otherwise "Misc"."""
+    label = str(label).strip().title()
+    return label if label in CATEGORIES else "Misc"
+
+async def get_category_from_ai(file_path_str, client, cache, sem):
     """
     Sends the path to OpenAI to determine the category.
+    Successful answers are stored in `cache` per path skeleton; failures are not.
+    The request holds a slot of `sem` while in flight.
     """
-    system_instruction = "You are a helpful file organization assistant."
+    skeleton = _path_skeleton(file_path_str)
+    if skeleton in cache:
+        return cache[skeleton]
     user_prompt = f"""
 Classify the following file path into exactly one of these categories: 
 {', '.join(CATEGORIES)}.
 
 Path: "{file_path_str}"
-
-Context:
-- Lecture: Slides, theory, chapters, week numbers usually imply lectures.
-- Lab: Code, practicals, experiments, 'practical'.
-- Tutorial: Problem sets, exercises, sheets, homework.
-- Misc: Syllabus, schedules, admin docs.
-
+{CATEGORY_CONTEXT}
 Reply ONLY with the category name. No punctuation.
     """
     try:
-        category = call_openai_with_retry(system_instruction, user_prompt)
-        return category if category in CATEGORIES else "Misc"
+        async with sem:
+            category = await call_openai_with_retry(client, SYSTEM_INSTRUCTION, user_prompt)
+        category = _to_category(category)
+        cache[skeleton] = category
+        return category
     except Exception as e:
         print(f"⚠️ FAILED after retries for '{file_path_str}': {e}")
         return "Misc"
 
+async def get_categories_from_ai(file_path_strs, client, cache, sem):
+    """
+    Classifies several paths with a single OpenAI request.
+    Returns categories in input order; falls back to one request per path
+    if the reply does not hold a category list of matching length.
+    `cache` maps path skeletons to categories already known for this upload;
+    every request, fallbacks included, holds a slot of `sem` while in flight.
+    """
+    todo = [p for p in file_path_strs if _path_skeleton(p) not in cache]
+    if todo:
+        user_prompt = BATCH_PROMPT_PREFIX + json.dumps(todo)
+        try:
+            async with sem:
+                reply = await call_openai_with_retry(client, SYSTEM_INSTRUCTION, user_prompt, json_mode=True)
+            labels = json.loads(reply)["categories"]
+            if not isinstance(labels, list) or len(labels) != len(todo):
+                raise ValueError(f"expected {len(todo)} labels, got {labels!r}")
+            for path, label in zip(todo, labels):
+                cache[_path_skeleton(path)] = _to_category(label)
+        except Exception as e:
+            print(f"⚠️ Batch of {len(todo)} paths failed ({e}), classifying one by one")
+            await asyncio.gather(*(get_category_from_ai(path, client, cache, sem) for path in todo))
+    return [cache.get(_path_skeleton(p), "Misc") for p in file_path_strs]
+
 # --- MAIN LOGIC ---
 
+def _extract_members(zip_ref, infos, dest):
+    """
+    Extracts the given members of an open zip into `dest`. Blocking; run it off the event loop.
+    """
+    # `extract` keeps zipfile's path sanitising (no writes outside the dir).
+    for zi in infos:
+        zip_ref.extract(zi, dest)
+
 def categorize_zip_content(zip_file_path):
     """
     Reads a zip file (without extracting), categorizes PDFs via AI, 
     and returns a dictionary of lists.
+    Sync entry point; all AI requests share one event loop.
+    """
+    return asyncio.run(categorize_zip_content_async(zip_file_path))
+
+async def categorize_zip_content_async(zip_file_path):
+    """
+    Async variant of `categorize_zip_content`.
     """
     # Initialize Dictionary
     categorized_files = {cat: [] for cat in CATEGORIES}
@@ -71,44 +145,64 @@ def categorize_zip_content(zip_file_path):
     
     try:
         # 1. Read the Zip Table of Contents
-        pdf_paths = []
+        # The archive stays open until extraction is done; only the worker thread reads from it after this.
         with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            # Get list of all files inside the zip
-            all_files = zip_ref.namelist()
-            
-            # Filter for PDFs (ignoring Mac OS hidden files)
-            for file in all_files:
-                if file.lower().endswith(".pdf") and "__MACOSX" not in file:
-                    pdf_paths.append(file)
-
-            # Unzip the file and place contents in the same directory
+            # One pass over the central directory; ZipInfo objects are reused for extraction
+            # Filter for PDFs (ignoring Mac OS hidden files and directories)
+            pdf_infos = [
+                zi for zi in zip_ref.infolist()
+                if not zi.is_dir() and zi.filename.lower().endswith(".pdf") and "__MACOSX" not in zi.filename
+            ]
+            pdf_paths = [zi.filename for zi in pdf_infos]
+
+            total_files = len(pdf_paths)
+            if total_files == 0:
+                print("No PDF files found inside the zip.")
+                return categorized_files
+
+            # Unzip the PDFs and place them in the same directory
             # This is a temporary solution since it's more convenient this way
             # You need to assume zip_file_path is in a temporary directory
-            zip_ref.extractall(zip_file_path.parent)
-
-        total_files = len(pdf_paths)
-        if total_files == 0:
-            print("No PDF files found inside the zip.")
-            return categorized_files
-
-        print(f"🚀 Categorizing {total_files} paths using AI...")
-
-        # 2. Parallel Processing (Just asking AI, no moving files)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # We map the future to the original path so we know which file it was
-            future_to_path = {
-                executor.submit(get_category_from_ai, path): path 
-                for path in pdf_paths
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_path):
-                original_path = future_to_path[future]
-                try:
-                    category = future.result()
-                    categorized_files[category].append(original_path)
-                    print(f"  -> [{category}] {original_path}")
-                except Exception as exc:
-                    print(f"❌ Error processing {original_path}: {exc}")
+            # Only PDFs are used downstream; skip everything else in the archive.
+            # Categorizing only needs the names, so inflate on a worker thread while the AI calls are in flight.
+            extraction = asyncio.to_thread(_extract_members, zip_ref, pdf_infos, zip_file_path.parent)
+
+            print(f"🚀 Categorizing {total_files} paths using AI...")
+
+            # Paths sharing a skeleton get one AI call, made for the first of them
+            by_skeleton = {}
+            for path in pdf_paths:
+                by_skeleton.setdefault(_path_skeleton(path), []).append(path)
+
+            # 2. Parallel Processing (Just asking AI, no moving files), BATCH_SIZE skeletons per request
+            groups = list(by_skeleton.values())
+            batches = [groups[i:i + BATCH_SIZE] for i in range(0, len(groups), BATCH_SIZE)]
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            # Path skeleton -> category for this upload only; numbered siblings
+            # (Week3/lec1.pdf, Week3/lec2.pdf) classify once
+            cache = {}
+
+            async def classify_all():
+                # One client per run: its connection pool is bound to this event loop
+                async with AsyncOpenAI() as client:
+                    return await asyncio.gather(
+                        *(get_categories_from_ai([paths[0] for paths in batch], client, cache, sem) for batch in batches),
+                        return_exceptions=True,
+                    )
+
+            # Let both finish before the archive closes, even if one of them fails
+            extracted, results = await asyncio.gather(extraction, classify_all(), return_exceptions=True)
+            for outcome in (extracted, results):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            for batch, categories in zip(batches, results):
+                if isinstance(categories, BaseException):
+                    print(f"❌ Error processing batch starting at {batch[0][0]}: {categories}")
+                    continue
+                for original_paths, category in zip(batch, categories):
+                    for original_path in original_paths:
+                        categorized_files[category].append(original_path)
+                        print(f"  -> [{category}] {original_path}")
 
     except zipfile.BadZipFile:
         print("❌ Error: The file is not a valid zip file.")
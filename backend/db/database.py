@@ -1,11 +1,14 @@
+import os
 import sqlite3
+import threading
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple
-from pydantic import BaseModel
 
-class Session(BaseModel):
-    """Session model"""
+@dataclass(frozen=True, slots=True)
+class Session:
+    """Session model (a typed sessions row; FastAPI serialises dataclasses directly)"""
     id: str
     name: str
     format: str
@@ -18,14 +21,29 @@ class DatabaseManager:
     def __init__(self, db_path: str = "db/sqlite.db", init: bool = False):
         """Initialize the database manager with the given database path."""
         self.db_path = Path(db_path)
-        # Create the db directory if it doesn't exist
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per thread (and per process, in case of fork), reused across calls
+        self._tls = threading.local()
         if init:
             self.init_db()
 
     def get_connection(self):
-        """Get a connection to the database."""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's connection to the database, opening it on first use.
+
+        `with conn:` still commits or rolls back per call; it does not close the
+        connection, so later calls skip the open/schema load.
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None or self._tls.pid != os.getpid():
+            # Create the db directory if it doesn't exist (deferred from __init__)
+            if not self.db_path.parent.exists():
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._tls.conn, self._tls.pid = conn, os.getpid()
+        return conn
 
     def init_db(self):
         """Initialize the database with the session table."""
@@ -49,6 +67,8 @@ class DatabaseManager:
                     session_id TEXT NOT NULL REFERENCES sessions(id)
                 )
             ''')
+            # list_resources filters on session_id
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_resources_session_id ON resources(session_id)')
             conn.commit()
 
     def create_session(self, name: str, format: str) -> Session:
@@ -75,34 +95,25 @@ class DatabaseManager:
             )
             row = cursor.fetchone()
             if row:
-                return Session(
-                    id=row[0],
-                    name=row[1],
-                    format=row[2],
-                    tex_id=row[3],
-                    json_id=row[4]
-                )
+                return Session(**dict(row))
             return None
 
     def update_session(self, session_id: str, name: Optional[str] = None, format: Optional[str] = None, tex_id: Optional[str] = None, json_id: Optional[str] = None, generation_metadata_id: Optional[str] = None) -> bool:
         """Update a session record. Returns True if the session was updated, False if not found."""
-        session = self.get_session(session_id)
-        if not session:
-            return False
-
-        # Use existing values if not provided
-        current_name, current_format, current_tex, current_json, current_generation_metadata = session.name, session.format, session.tex_id, session.json_id, session.generation_metadata_id
-        new_name = name if name is not None else current_name
-        new_format = format if format is not None else current_format
-        new_tex = tex_id if tex_id is not None else current_tex
-        new_json = json_id if json_id is not None else current_json
-        new_generation_metadata = generation_metadata_id if generation_metadata_id is not None else current_generation_metadata
-
+        # One statement: fields passed as None keep their stored value
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "UPDATE sessions SET name = ?, format = ?, tex_id = ?, json_id = ?, generation_metadata_id = ? WHERE id = ?",
-                (new_name, new_format, new_tex, new_json, new_generation_metadata, session_id)
+                """
+                UPDATE sessions SET
+                    name = COALESCE(?, name),
+                    format = COALESCE(?, format),
+                    tex_id = COALESCE(?, tex_id),
+                    json_id = COALESCE(?, json_id),
+                    generation_metadata_id = COALESCE(?, generation_metadata_id)
+                WHERE id = ?
+                """,
+                (name, format, tex_id, json_id, generation_metadata_id, session_id)
             )
             conn.commit()
             return cursor.rowcount > 0
@@ -121,26 +132,17 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("SELECT id, name, format, tex_id, json_id, generation_metadata_id FROM sessions")
             rows = cursor.fetchall()
-            return [
-                Session(
-                    id=row[0],
-                    name=row[1],
-                    format=row[2],
-                    tex_id=row[3],
-                    json_id=row[4],
-                    generation_metadata_id=row[5]
-                )
-                for row in rows
-            ]
+            return [Session(**dict(row)) for row in rows]
 
     def add_resources(self, session_id: str, resource_ids: list[str]) -> None:
         """Add resource records associated with a session."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # TODO: optimize? this is still more than one query i think
+            # One write transaction for the whole batch; rows are streamed, not materialised
+            cursor.execute("BEGIN IMMEDIATE")
             cursor.executemany(
                 "INSERT INTO resources (id, session_id) VALUES (?, ?)",
-                [(resource_id, session_id) for resource_id in resource_ids]
+                ((resource_id, session_id) for resource_id in resource_ids)
             )
             conn.commit()
 
@@ -153,41 +155,48 @@ class DatabaseManager:
             return [row[0] for row in rows]
 
 
-# Global instance for convenience
-db_manager = DatabaseManager()
+# Global instance for convenience, created on first use so importing does no filesystem I/O
+_db_manager: Optional[DatabaseManager] = None
+
+
+def _get_db() -> DatabaseManager:
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
 
 
 # Convenience functions that use the global instance
 def create_session(name: str, format: str) -> Session:
     """Create a new session record and return the session ID."""
-    return db_manager.create_session(name, format)
+    return _get_db().create_session(name, format)
 
 
 def get_session(session_id: str) -> Optional[Session]:
     """Get a session record by ID."""
-    return db_manager.get_session(session_id)
+    return _get_db().get_session(session_id)
 
 
 def update_session(session_id: str, name: Optional[str] = None, format: Optional[str] = None, tex_id: Optional[str] = None, json_id: Optional[str] = None, generation_metadata_id: Optional[str] = None) -> bool:
     """Update a session record. Returns True if the session was updated, False if not found."""
-    return db_manager.update_session(session_id, name, format, tex_id, json_id, generation_metadata_id)
+    return _get_db().update_session(session_id, name, format, tex_id, json_id, generation_metadata_id)
 
 
 def delete_session(session_id: str) -> bool:
     """Delete a session record. Returns True if deleted, False if not found."""
-    return db_manager.delete_session(session_id)
+    return _get_db().delete_session(session_id)
 
 
 def list_sessions() -> list[Session]:
     """Get all session records."""
-    return db_manager.list_sessions()
+    return _get_db().list_sessions()
 
 
 def add_resources(session_id: str, resource_ids: list[str]) -> None:
     """Add resource records associated with a session."""
-    return db_manager.add_resources(session_id, resource_ids)
+    return _get_db().add_resources(session_id, resource_ids)
 
 
 def list_resources(session_id: str) -> list[str]:
     """Get all resource IDs associated with a session."""
-    return db_manager.list_resources(session_id)
\ No newline at end of file
+    return _get_db().list_resources(session_id)
\ No newline at end of file
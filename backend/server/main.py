@@ -160,16 +160,24 @@ def extract_zip_recursive(zip_path: Path, extract_to: Path) -> list[Path]:
 """
 
 
-async def process_uploaded_file(content: bytes, temp_dir: Path) -> Path:
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+async def process_uploaded_file(file: UploadFile, temp_dir: Path) -> Path:
     """
     Process an uploaded file, extracting zips recursively if needed.
     Returns a list of file paths ready for upload.
     """
-    # Save the uploaded file to temp directory
+    # Save the uploaded file to temp directory, streaming it in fixed-size chunks
+    # so memory stays O(chunk) instead of O(upload)
     file_path = temp_dir / "file.zip"
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    await asyncio.to_thread(file_path.write_bytes, content)
+    def _copy() -> None:
+        with file_path.open("wb") as out:
+            shutil.copyfileobj(file.file, out, UPLOAD_CHUNK_SIZE)
+
+    await asyncio.to_thread(_copy)
 
     return file_path
     
@@ -197,20 +205,17 @@ async def process_uploaded_file(content: bytes, temp_dir: Path) -> Path:
 # Process pool for running blocking agent pipeline
 agent_process_pool = ProcessPoolExecutor()
 
-async def run_agent_pipeline(session: Session, content: bytes):
+async def run_agent_pipeline(session: Session, zip_file_path: Path):
     """
     Run the agent pipeline for the given session ID.
     This is a blocking call and should be run in a separate process.
     In this case, we pass it to a ProcessPoolExecutor.
+    Takes ownership of the upload's temporary directory and removes it when done.
     """
     try:
         # Create a temporary directory for processing
-        with tempfile.TemporaryDirectory() as temp_dir_str, tempfile.TemporaryDirectory() as output_dir_str:
-            temp_dir = Path(temp_dir_str)
+        with tempfile.TemporaryDirectory() as output_dir_str:
             output_dir = Path(output_dir_str)
-            
-            # Process uploaded files
-            zip_file_path = await process_uploaded_file(content, temp_dir)
 
             # Run pipeline in a separate process and wait for completion
             await asyncio.get_running_loop().run_in_executor(
@@ -254,6 +259,8 @@ async def run_agent_pipeline(session: Session, content: bytes):
         # Notify client of error
         print(traceback.format_exc())
         await push_event_to_session(session.id, { "event": "contentError", "message": str(e) })
+    finally:
+        await asyncio.to_thread(shutil.rmtree, zip_file_path.parent, True)
 
 async def event_stream(session_id: str) -> AsyncGenerator[str, None]:
     """
@@ -295,13 +302,17 @@ async def create_session(
 
     session = db.create_session(name=name, format=format)
 
-    # Read the file in advance
+    # Save the file in advance
     # This is because UploadFile cannot be passed to a background task otherwise it will close
-    file = files[0]
-    content = await file.read()
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        zip_file_path = await process_uploaded_file(files[0], temp_dir)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
 
     # Send job to agent to start processing the resource_ids
-    asyncio.create_task(run_agent_pipeline(session, content))
+    asyncio.create_task(run_agent_pipeline(session, zip_file_path))
 
     return session
 
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import categorizer.main as categorizer
+
+
+class FakeClient:
+    """
+    Stands in for AsyncOpenAI; every chat completion replies with `content`.
+    """
+
+    def __init__(self, content: str):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._content = content
+
+    async def _create(self, **kwargs):
+        message = SimpleNamespace(content=self._content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def check_batch_labels_are_normalised():
+    """
+    Lowercase or padded labels from the batched JSON reply map onto CATEGORIES.
+    """
+    paths = ["CS101/Week1/lecture1.pdf", "CS101/labs/lab_sheet.pdf", "CS101/tut/t1.pdf"]
+    client = FakeClient(json.dumps({"categories": ["lecture", "Lab ", " TUTORIAL"]}))
+
+    categories = asyncio.run(categorizer.get_categories_from_ai(paths, client, {}, asyncio.Semaphore(1)))
+
+    assert categories == ["Lecture", "Lab", "Tutorial"], categories
+    print("OK: batch labels are normalised")
+
+
+def check_unknown_batch_label_falls_back_to_misc():
+    """
+    A label outside CATEGORIES is filed as Misc.
+    """
+    client = FakeClient(json.dumps({"categories": ["slides"]}))
+
+    categories = asyncio.run(categorizer.get_categories_from_ai(["CS101/x.pdf"], client, {}, asyncio.Semaphore(1)))
+
+    assert categories == ["Misc"], categories
+    print("OK: unknown label falls back to Misc")
+
+
+def check_fallback_respects_semaphore():
+    """
+    When the batch reply is unusable, the per-path fallback stays under the request cap.
+    """
+    in_flight = peak = 0
+
+    class CountingClient(FakeClient):
+        async def _create(self, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await super()._create(**kwargs)
+
+    # Not a {"categories": [...]} object, so the batch fails and each path is asked alone
+    client = CountingClient("Lecture")
+    paths = [f"CS101/topic{c}/notes.pdf" for c in "abcdefgh"]
+
+    async def run():
+        return await categorizer.get_categories_from_ai(paths, client, {}, asyncio.Semaphore(2))
+
+    categories = asyncio.run(run())
+
+    assert categories == ["Lecture"] * len(paths), categories
+    assert peak <= 2, peak
+    print("OK: fallback respects the concurrency cap")
+
+
+if __name__ == "__main__":
+    # Offline checks for the categorizer; no API key or server needed
+    check_batch_labels_are_normalised()
+    check_unknown_batch_label_falls_back_to_misc()
+    check_fallback_respects_semaphore()